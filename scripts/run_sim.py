@@ -5,12 +5,12 @@ import argparse
 from pathlib import Path
 
 from ws_sim.monte_carlo import (
+    SIMULATION_BACKENDS,
     DeckConfig,
-    cumulative_probability_at_least,
+    cumulative_probability_at_least_array,
     simulate_trials,
     tune_trial_count,
 )
-from ws_sim.plotting import plot_cumulative_histogram
 
 
 def parse_args() -> argparse.Namespace:
@@ -63,6 +63,18 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--target-error", type=float, default=0.01, help="Absolute error tolerance for auto-tuning")
     parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument(
+        "--backend",
+        choices=SIMULATION_BACKENDS,
+        default="python",
+        help="Simulation backend; 'numpy' resolves all trials in vectorized batches",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes to shard trials across (default: run in-process)",
+    )
     parser.add_argument("--png", type=Path, default=None, help="Optional path to save the histogram image")
     return parser.parse_args()
 
@@ -89,15 +101,25 @@ def main() -> None:
             target_error=args.target_error,
             min_trials=args.trials,
             seed=args.seed,
+            backend=args.backend,
+            workers=args.workers,
         )
 
-    damages = simulate_trials(args.damages, config, trials=trials, seed=args.seed)
-    max_damage = max(damages)
-    thresholds = range(0, max_damage + 1)
-    probabilities = cumulative_probability_at_least(damages, thresholds)
+    damages = simulate_trials(
+        args.damages,
+        config,
+        trials=trials,
+        seed=args.seed,
+        backend=args.backend,
+        workers=args.workers,
+    )
+    probabilities = dict(enumerate(cumulative_probability_at_least_array(damages).tolist()))
 
-    fig, ax = plot_cumulative_histogram(probabilities)
     if args.png:
+        # matplotlib is slow to import; only load it when a plot is requested.
+        from ws_sim.plotting import plot_cumulative_histogram
+
+        fig, ax = plot_cumulative_histogram(probabilities)
         ax.text(
             0.99,
             0.95,
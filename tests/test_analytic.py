@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+import pytest
+
+from ws_sim.analytic import (
+    fourth_cancel_bonus_damage_distribution,
+    p_fourth_cancel,
+    p_no_cancel,
+    reveal_nine_clock_distribution,
+)
+from ws_sim.monte_carlo import (
+    DeckConfig,
+    main_phase_fourth_cancel_bonus_damage,
+    reveal_nine_clock_climaxes,
+    simulate_trials,
+)
+
+
+def test_p_fourth_cancel_matches_sequential_draw_probability():
+    assert math.isclose(p_fourth_cancel(8, 1), 1 / 8)
+    assert math.isclose(p_fourth_cancel(10, 2), (8 / 10) * (7 / 9) * (6 / 8) * (2 / 7))
+
+
+def test_fourth_cancel_bonus_distribution_sums_to_one():
+    distribution = fourth_cancel_bonus_damage_distribution(50, 8)
+
+    assert set(distribution) == {0, 4}
+    assert math.isclose(sum(distribution.values()), 1.0)
+    assert distribution[4] > p_no_cancel(50, 8, 4)
+
+
+def test_reveal_nine_distribution_without_climaxes_is_certain():
+    assert reveal_nine_clock_distribution(20, 0) == {0: 1.0}
+
+
+@pytest.mark.parametrize(
+    "step, distribution",
+    [
+        (main_phase_fourth_cancel_bonus_damage, fourth_cancel_bonus_damage_distribution(12, 3)),
+        (reveal_nine_clock_climaxes, reveal_nine_clock_distribution(12, 3)),
+    ],
+)
+def test_closed_forms_match_python_simulation(step, distribution):
+    config = DeckConfig(deck_cards=12, deck_climax_cards=3)
+
+    damages = simulate_trials([], config, trials=20000, seed=21, main_phase_steps=[step])
+
+    for damage, probability in distribution.items():
+        assert math.isclose(np.count_nonzero(damages == damage) / len(damages), probability, abs_tol=0.02)
+
+
+def test_numpy_backend_samples_lone_builtin_step_from_closed_form():
+    config = DeckConfig(deck_cards=12, deck_climax_cards=3)
+    steps = [main_phase_fourth_cancel_bonus_damage]
+
+    damages = simulate_trials([], config, trials=20000, seed=4, main_phase_steps=steps, backend="numpy")
+
+    assert set(damages) <= {0, 4}
+    assert math.isclose(
+        np.count_nonzero(damages == 4) / len(damages),
+        fourth_cancel_bonus_damage_distribution(12, 3)[4],
+        abs_tol=0.02,
+    )
+
+
+def test_numpy_backend_samples_lone_damage_from_closed_form():
+    config = DeckConfig(deck_cards=12, deck_climax_cards=3)
+
+    damages = simulate_trials([3], config, trials=20000, seed=4, backend="numpy")
+
+    assert set(damages) <= {0, 3}
+    assert math.isclose(
+        np.count_nonzero(damages == 3) / len(damages), p_no_cancel(12, 3, 3), abs_tol=0.02
+    )
+
+
+def test_closed_forms_reject_decks_that_would_refresh():
+    with pytest.raises(ValueError):
+        fourth_cancel_bonus_damage_distribution(7, 1)
+    with pytest.raises(ValueError):
+        reveal_nine_clock_distribution(8, 1)
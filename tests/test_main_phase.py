@@ -1,5 +1,7 @@
 import random
 
+import numpy as np
+
 from ws_sim.main_phase import (
     apply_seeded_top_stack,
     run_main_phase_and_battle,
@@ -42,7 +44,7 @@ def test_seeded_stack_triggers_conditional_main_phase_damage():
         seed=9,
     )
 
-    assert damages == [4]
+    assert damages.tolist() == [4]
 
 
 def test_seed_top_stack_places_climax_on_fourth_damage_card():
@@ -70,7 +72,7 @@ def test_fourth_cancel_triggers_followup_damage_with_seed_top_stack():
 
     assert damage == 4
     assert len(state.deck) == 0
-    assert state.waiting_room[3] is True
+    assert state.waiting_room[3] == 1
 
 
 def test_seed_top_stack_early_cancel_blocks_bonus_damage():
@@ -113,4 +115,30 @@ def test_seeded_stack_applies_before_battle_attacks():
         seed=1,
     )
 
-    assert damages == [0]
+    assert damages.tolist() == [0]
+
+
+def test_seed_top_stack_with_numpy_generator():
+    rng = np.random.default_rng(0)
+    config = DeckConfig(deck_cards=8, deck_climax_cards=3, rng_backend="numpy")
+    state = DeckState(config, rng)
+
+    seed_top_stack(state, [True, False])
+
+    assert [state.draw()[0] for _ in range(2)] == [True, False]
+    assert len(state.deck) == 6
+    assert sum(state.deck) == 2
+
+
+def test_apply_seeded_top_stack_snapshots_the_stack():
+    config = DeckConfig(deck_cards=6, deck_climax_cards=2)
+    top_stack = [False, True, False]
+    step = apply_seeded_top_stack(top_stack)
+    top_stack[0] = True
+
+    state = DeckState(config, random.Random(2))
+    assert step(state) == 0
+
+    assert state.deck[3:] == (False, True, False)
+    assert sum(state.deck) == 2
+    assert [state.draw()[0] for _ in range(3)] == [False, True, False]
@@ -1,19 +1,30 @@
 import math
 import random
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pytest
 
+from ws_sim.main_phase import apply_seeded_top_stack, seed_top_stack
 from ws_sim.monte_carlo import (
+    AttackingDeckState,
     DamageEvent,
     DeckConfig,
     DeckState,
     MagicStoneResult,
+    _build_attacking_deck,
+    _compile_damage_kernel,
+    _resolve_damage_event,
+    _simulate_attack,
+    _uniform_source,
     apply_magic_stone_effect,
     cumulative_probability_at_least,
+    cumulative_probability_at_least_array,
     main_phase_fourth_cancel_bonus_damage,
     reveal_nine_clock_climaxes,
     simulate_trials,
     tune_trial_count,
+    waiting_room_template_for,
 )
 
 
@@ -101,7 +112,7 @@ def test_reproducible_trials():
     config = DeckConfig(deck_cards=50, deck_climax_cards=8)
     first = simulate_trials(damage_sequence, config, trials=500, seed=123)
     second = simulate_trials(damage_sequence, config, trials=500, seed=123)
-    assert first == second
+    np.testing.assert_array_equal(first, second)
 
 
 def test_mixed_damage_events_apply_triggers_only_to_attacks():
@@ -119,7 +130,7 @@ def test_mixed_damage_events_apply_triggers_only_to_attacks():
 
     damages = simulate_trials(damage_sequence, config, trials=1, seed=5)
 
-    assert damages == [6]
+    assert damages.tolist() == [6]
 
 
 def test_mixed_damage_trials_are_reproducible():
@@ -138,7 +149,7 @@ def test_mixed_damage_trials_are_reproducible():
     first = simulate_trials(damage_sequence, config, trials=500, seed=2024)
     second = simulate_trials(damage_sequence, config, trials=500, seed=2024)
 
-    assert first == second
+    np.testing.assert_array_equal(first, second)
 
 
 def test_attack_trigger_applies_bonus_damage():
@@ -150,7 +161,7 @@ def test_attack_trigger_applies_bonus_damage():
     )
     damages = simulate_trials([1], config, trials=3, seed=7)
 
-    assert damages == [2, 2, 2]
+    assert damages.tolist() == [2, 2, 2]
 
 
 def test_cumulative_probability_is_monotonic():
@@ -181,10 +192,11 @@ def test_trial_tuning_converges():
     )
 
     assert chosen_trials >= 200
-    assert chosen_trials <= 5000
-    # Final two estimates should be within the target error margin
+    assert chosen_trials < 5000
     assert len(history) >= 2
-    assert math.isclose(history[-1], history[-2], rel_tol=0, abs_tol=0.02)
+    # Tuning stops on the binomial standard error, not on neighbouring estimates agreeing.
+    estimate = history[-1]
+    assert 1.96 * math.sqrt(estimate * (1 - estimate) / chosen_trials) <= 0.02
 
 
 def test_attacking_deck_validation():
@@ -257,4 +269,550 @@ def test_simulate_trials_runs_main_phase_steps_first():
     expected_state = DeckState(config, rng)
     expected_main_phase_damage = main_phase_fourth_cancel_bonus_damage(expected_state)
 
-    assert damages == [expected_main_phase_damage]
+    assert damages.tolist() == [expected_main_phase_damage]
+
+
+def test_numpy_backend_is_reproducible():
+    config = DeckConfig(
+        deck_cards=20,
+        deck_climax_cards=4,
+        waiting_room_cards=6,
+        waiting_room_climax_cards=2,
+        attacking_deck_size=5,
+        attacking_soul_trigger_cards=2,
+    )
+    damage_sequence = [3, DamageEvent(base_damage=2, is_attack=False), 3, 3, 4, 4, 3]
+
+    first = simulate_trials(damage_sequence, config, trials=500, seed=11, backend="numpy")
+    second = simulate_trials(damage_sequence, config, trials=500, seed=11, backend="numpy")
+
+    np.testing.assert_array_equal(first, second)
+    assert len(first) == 500
+
+
+def test_numpy_backend_counts_triggers_and_refresh_penalties():
+    config = DeckConfig(
+        deck_cards=3,
+        deck_climax_cards=0,
+        attacking_deck_size=1,
+        attacking_soul_trigger_cards=1,
+    )
+    damage_sequence = [1, DamageEvent(base_damage=2, is_attack=False), 1]
+
+    damages = simulate_trials(damage_sequence, config, trials=4, seed=3, backend="numpy")
+
+    # 2 + 2 + 1 damage drains the 3-card deck once, adding one refresh penalty.
+    assert damages.tolist() == [6, 6, 6, 6]
+
+
+def test_numpy_backend_matches_python_distribution():
+    config = DeckConfig(
+        deck_cards=12,
+        deck_climax_cards=3,
+        waiting_room_cards=4,
+        waiting_room_climax_cards=1,
+    )
+    damage_sequence = [3, 3, 2, 3, 3]
+    thresholds = [3, 6, 9]
+
+    python = cumulative_probability_at_least(
+        simulate_trials(damage_sequence, config, trials=4000, seed=5), thresholds
+    )
+    vectorized = cumulative_probability_at_least(
+        simulate_trials(damage_sequence, config, trials=4000, seed=5, backend="numpy"),
+        thresholds,
+    )
+
+    for threshold in thresholds:
+        assert math.isclose(python[threshold], vectorized[threshold], abs_tol=0.05)
+
+
+def test_numpy_backend_matches_python_distribution_with_builtin_steps():
+    config = DeckConfig(
+        deck_cards=14,
+        deck_climax_cards=3,
+        waiting_room_cards=4,
+        waiting_room_climax_cards=2,
+    )
+    damage_sequence = [3, 2, 3]
+    steps = [main_phase_fourth_cancel_bonus_damage, reveal_nine_clock_climaxes]
+    thresholds = [2, 5, 8, 11]
+
+    python = cumulative_probability_at_least(
+        simulate_trials(damage_sequence, config, trials=6000, seed=4, main_phase_steps=steps),
+        thresholds,
+    )
+    vectorized = cumulative_probability_at_least(
+        simulate_trials(
+            damage_sequence, config, trials=6000, seed=4, main_phase_steps=steps, backend="numpy"
+        ),
+        thresholds,
+    )
+
+    for threshold in thresholds:
+        assert math.isclose(python[threshold], vectorized[threshold], abs_tol=0.04)
+
+
+def test_numpy_backend_falls_back_for_custom_main_phase_steps():
+    config = DeckConfig(deck_cards=8, deck_climax_cards=1)
+
+    def clock_top_card(deck_state):
+        card, refreshed = deck_state.draw()
+        return int(card) + int(refreshed)
+
+    python = simulate_trials([2], config, trials=50, seed=8, main_phase_steps=[clock_top_card])
+    fallback = simulate_trials(
+        [2],
+        config,
+        trials=50,
+        seed=8,
+        main_phase_steps=[clock_top_card],
+        backend="numpy",
+    )
+
+    np.testing.assert_array_equal(python, fallback)
+
+
+def test_plain_int_damage_matches_attack_events_and_is_validated():
+    config = DeckConfig(deck_cards=20, deck_climax_cards=4, attacking_deck_size=8, attacking_soul_trigger_cards=2)
+
+    plain = simulate_trials([3, 2, 3], config, trials=200, seed=13)
+    events = simulate_trials([DamageEvent(3), DamageEvent(2), DamageEvent(3)], config, trials=200, seed=13)
+
+    np.testing.assert_array_equal(plain, events)
+    with pytest.raises(ValueError):
+        simulate_trials([3, -1], config, trials=1)
+    with pytest.raises(TypeError):
+        simulate_trials([3, "2"], config, trials=1)
+
+
+def test_unknown_backend_is_rejected():
+    config = DeckConfig(deck_cards=10, deck_climax_cards=2)
+    with pytest.raises(ValueError):
+        simulate_trials([1], config, trials=1, backend="fortran")
+
+
+def test_numba_backend_matches_python_distribution_with_builtin_steps():
+    pytest.importorskip("numba")
+    config = DeckConfig(
+        deck_cards=14,
+        deck_climax_cards=3,
+        waiting_room_cards=4,
+        waiting_room_climax_cards=2,
+        attacking_deck_size=3,
+        attacking_soul_trigger_cards=1,
+    )
+    damage_sequence = [3, DamageEvent(base_damage=1, is_attack=False), 3, 2]
+    steps = [main_phase_fourth_cancel_bonus_damage, reveal_nine_clock_climaxes]
+    thresholds = [4, 8, 12]
+
+    python = cumulative_probability_at_least(
+        simulate_trials(damage_sequence, config, trials=4000, seed=6, main_phase_steps=steps),
+        thresholds,
+    )
+    compiled = simulate_trials(
+        damage_sequence, config, trials=4000, seed=6, main_phase_steps=steps, backend="numba"
+    )
+
+    np.testing.assert_array_equal(
+        compiled,
+        simulate_trials(
+            damage_sequence, config, trials=4000, seed=6, main_phase_steps=steps, backend="numba"
+        ),
+    )
+    compiled_probabilities = cumulative_probability_at_least(compiled, thresholds)
+    for threshold in thresholds:
+        assert math.isclose(python[threshold], compiled_probabilities[threshold], abs_tol=0.05)
+
+
+def test_numba_backend_falls_back_for_custom_steps():
+    config = DeckConfig(deck_cards=8, deck_climax_cards=1)
+
+    def custom_step(deck_state):
+        return 1
+
+    damages = simulate_trials(
+        [2], config, trials=20, seed=4, main_phase_steps=[custom_step], backend="numba"
+    )
+
+    np.testing.assert_array_equal(
+        damages, simulate_trials([2], config, trials=20, seed=4, main_phase_steps=[custom_step])
+    )
+
+
+def test_parallel_workers_are_reproducible():
+    config = DeckConfig(deck_cards=30, deck_climax_cards=6)
+
+    first = simulate_trials([3, 2, 3], config, trials=101, seed=17, workers=2)
+    second = simulate_trials([3, 2, 3], config, trials=101, seed=17, workers=2)
+
+    np.testing.assert_array_equal(first, second)
+    assert len(first) == 101
+
+
+def test_parallel_results_do_not_depend_on_cpu_count(monkeypatch):
+    config = DeckConfig(deck_cards=30, deck_climax_cards=6)
+    uncapped = simulate_trials([3, 2, 3], config, trials=60, seed=23, workers=3)
+
+    monkeypatch.setattr("os.cpu_count", lambda: 1)
+    capped = simulate_trials([3, 2, 3], config, trials=60, seed=23, workers=3)
+
+    np.testing.assert_array_equal(uncapped, capped)
+
+
+def test_parallel_results_do_not_depend_on_the_executor():
+    config = DeckConfig(deck_cards=30, deck_climax_cards=6)
+    own_pool = simulate_trials([3, 2, 3], config, trials=60, seed=23, workers=3)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        shared = simulate_trials([3, 2, 3], config, trials=60, seed=23, workers=3, executor=executor)
+        again = simulate_trials([3, 2, 3], config, trials=60, seed=23, workers=3, executor=executor)
+
+    np.testing.assert_array_equal(own_pool, shared)
+    np.testing.assert_array_equal(shared, again)
+
+
+def test_tune_trial_count_with_workers_is_reproducible():
+    config = DeckConfig(deck_cards=30, deck_climax_cards=6)
+
+    first = tune_trial_count([3, 2], config, threshold=3, min_trials=200, max_trials=800, seed=8, workers=2)
+    second = tune_trial_count([3, 2], config, threshold=3, min_trials=200, max_trials=800, seed=8, workers=2)
+
+    assert first == second
+
+
+def test_parallel_workers_match_sequential_distribution():
+    config = DeckConfig(
+        deck_cards=12,
+        deck_climax_cards=3,
+        waiting_room_cards=4,
+        waiting_room_climax_cards=1,
+    )
+    damage_sequence = [3, 3, 2, 3, 3]
+    thresholds = [3, 6, 9]
+
+    sequential = cumulative_probability_at_least(
+        simulate_trials(damage_sequence, config, trials=4000, seed=5), thresholds
+    )
+    parallel = cumulative_probability_at_least(
+        simulate_trials(damage_sequence, config, trials=4000, seed=5, workers=2), thresholds
+    )
+
+    for threshold in thresholds:
+        assert math.isclose(sequential[threshold], parallel[threshold], abs_tol=0.05)
+
+
+def test_parallel_workers_run_unpicklable_steps_sequentially():
+    config = DeckConfig(deck_cards=8, deck_climax_cards=1)
+    steps = [apply_seeded_top_stack([False, False, False, True])]
+
+    with pytest.warns(RuntimeWarning):
+        damages = simulate_trials([], config, trials=3, seed=2, main_phase_steps=steps, workers=2)
+
+    np.testing.assert_array_equal(
+        damages, simulate_trials([], config, trials=3, seed=2, main_phase_steps=steps)
+    )
+
+
+def test_workers_must_be_positive():
+    config = DeckConfig(deck_cards=10, deck_climax_cards=2)
+    with pytest.raises(ValueError):
+        simulate_trials([1], config, trials=1, workers=0)
+
+
+def test_numba_backend_requires_numba_for_builtin_steps(monkeypatch):
+    from ws_sim import _kernels
+
+    monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+    config = DeckConfig(deck_cards=8, deck_climax_cards=1)
+
+    with pytest.raises(ImportError):
+        simulate_trials([2], config, trials=5, seed=1, backend="numba")
+    with pytest.raises(ImportError):
+        simulate_trials(
+            [2],
+            config,
+            trials=5,
+            seed=1,
+            main_phase_steps=[reveal_nine_clock_climaxes],
+            backend="numba",
+        )
+
+
+def test_cumulative_probability_counts_thresholds_outside_range():
+    probabilities = cumulative_probability_at_least([0, 2, 2, 5], [-1, 0, 1, 2, 5, 6])
+
+    assert probabilities == {-1: 1.0, 0: 1.0, 1: 0.75, 2: 0.75, 5: 0.25, 6: 0.0}
+    assert all(type(value) is float for value in probabilities.values())
+
+
+def test_cumulative_probability_handles_negative_damages():
+    probabilities = cumulative_probability_at_least([-2, 0, 3, 3], [-3, -1, 0, 3, 4])
+
+    assert probabilities == {-3: 1.0, -1: 0.75, 0: 0.75, 3: 0.5, 4: 0.0}
+
+
+def test_cumulative_probability_array_matches_mapping():
+    damages = [0, 2, 2, 5, 3, 0, 1]
+
+    probabilities = cumulative_probability_at_least_array(damages)
+
+    expected = cumulative_probability_at_least(damages, range(6))
+    assert probabilities.tolist() == [expected[threshold] for threshold in range(6)]
+    with pytest.raises(ValueError):
+        cumulative_probability_at_least_array([])
+
+
+def test_trial_tuning_stops_early_for_unreachable_threshold():
+    config = DeckConfig(deck_cards=45, deck_climax_cards=8)
+
+    chosen_trials, history = tune_trial_count(
+        [3, 3, 3], config, threshold=30, target_error=0.02, min_trials=200, max_trials=5000, seed=99
+    )
+
+    assert chosen_trials == 400
+    assert history == [0.0, 0.0]
+
+
+def test_trial_tuning_caps_at_max_trials():
+    config = DeckConfig(deck_cards=45, deck_climax_cards=8)
+
+    chosen_trials, history = tune_trial_count(
+        [3, 3, 3], config, threshold=6, target_error=0.001, min_trials=200, max_trials=1000, seed=3
+    )
+
+    assert chosen_trials == 1000
+    assert len(history) == 4
+
+
+def test_trial_tuning_is_reproducible_for_a_seed():
+    config = DeckConfig(deck_cards=45, deck_climax_cards=8)
+    kwargs = dict(threshold=6, target_error=0.02, min_trials=200, max_trials=5000, seed=17)
+
+    assert tune_trial_count([3, 3, 3], config, **kwargs) == tune_trial_count([3, 3, 3], config, **kwargs)
+
+
+def test_uniform_source_prefetches_generator_values_in_order():
+    uniform = _uniform_source(np.random.default_rng(21))
+
+    values = [uniform() for _ in range(5000)]
+
+    assert values == np.random.default_rng(21).random(8192)[:5000].tolist()
+
+
+def test_numpy_rng_backend_is_reproducible_and_matches_stdlib():
+    stdlib_config = DeckConfig(
+        deck_cards=12,
+        deck_climax_cards=3,
+        waiting_room_cards=4,
+        waiting_room_climax_cards=1,
+        attacking_deck_size=6,
+        attacking_soul_trigger_cards=2,
+    )
+    numpy_config = DeckConfig(
+        deck_cards=12,
+        deck_climax_cards=3,
+        waiting_room_cards=4,
+        waiting_room_climax_cards=1,
+        attacking_deck_size=6,
+        attacking_soul_trigger_cards=2,
+        rng_backend="numpy",
+    )
+    damage_sequence = [3, 3, 2, 3, 3]
+    thresholds = [3, 6, 9]
+
+    first = simulate_trials(damage_sequence, numpy_config, trials=4000, seed=5)
+    np.testing.assert_array_equal(
+        first, simulate_trials(damage_sequence, numpy_config, trials=4000, seed=5)
+    )
+
+    stdlib = cumulative_probability_at_least(
+        simulate_trials(damage_sequence, stdlib_config, trials=4000, seed=5), thresholds
+    )
+    numpy_probabilities = cumulative_probability_at_least(first, thresholds)
+    for threshold in thresholds:
+        assert math.isclose(stdlib[threshold], numpy_probabilities[threshold], abs_tol=0.05)
+
+
+def test_unknown_rng_backend_is_rejected():
+    with pytest.raises(ValueError):
+        DeckConfig(deck_cards=10, deck_climax_cards=2, rng_backend="lcg")
+
+
+def test_compiled_damage_kernel_matches_per_event_resolution():
+    config = DeckConfig(
+        deck_cards=9,
+        deck_climax_cards=2,
+        waiting_room_cards=3,
+        waiting_room_climax_cards=1,
+        attacking_deck_size=4,
+        attacking_soul_trigger_cards=2,
+    )
+    events = (
+        DamageEvent(base_damage=2),
+        DamageEvent(base_damage=3, is_attack=False),
+        DamageEvent(base_damage=0),
+        DamageEvent(base_damage=3),
+        DamageEvent(base_damage=4),
+    )
+    kernel = _compile_damage_kernel(
+        tuple((event.base_damage, event.is_attack) for event in events), True
+    )
+
+    for seed in range(50):
+        compiled_rng = random.Random(seed)
+        compiled_state = DeckState(config, compiled_rng)
+        compiled_attacks = _build_attacking_deck(config, compiled_rng)
+        compiled = kernel(compiled_state.reveal, compiled_attacks.resolve_soul_trigger)
+
+        reference_rng = random.Random(seed)
+        reference_state = DeckState(config, reference_rng)
+        reference_attacks = _build_attacking_deck(config, reference_rng)
+        reference = 0
+        for event in events:
+            if event.is_attack:
+                reference += sum(_simulate_attack(event.base_damage, reference_state, reference_attacks))
+            else:
+                reference += sum(_resolve_damage_event(event.base_damage, reference_state)[:2])
+
+        assert compiled == reference
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_simulate_trials_returns_int32_array(backend):
+    config = DeckConfig(deck_cards=20, deck_climax_cards=4)
+
+    damages = simulate_trials([2, 3], config, trials=10, seed=1, backend=backend)
+
+    assert isinstance(damages, np.ndarray)
+    assert damages.dtype == np.int32
+    assert damages.shape == (10,)
+
+
+def test_climax_in_deck_tracks_draws_and_assignment():
+    state = DeckState(DeckConfig(deck_cards=10, deck_climax_cards=3), random.Random(4))
+    assert state.climax_in_deck == 3
+
+    state.deck = [True, False, True, False]
+    state.waiting_room = []
+    assert state.climax_in_deck == 2
+
+    state.draw()
+    state.draw()
+    assert state.climax_in_deck == 1
+    assert state.deck_len == 2
+
+
+def test_deck_state_rejects_mismatched_waiting_room_template():
+    config = DeckConfig(deck_cards=10, deck_climax_cards=3, waiting_room_cards=2, waiting_room_climax_cards=1)
+
+    with pytest.raises(ValueError):
+        DeckState(config, random.Random(0), waiting_room_template=b"\x01\x01")
+
+
+def test_reset_restores_starting_position_and_reseeds():
+    config = DeckConfig(deck_cards=10, deck_climax_cards=3, waiting_room_cards=4, waiting_room_climax_cards=1)
+    state = DeckState(config, random.Random(5))
+    first_draws = [state.draw()[0] for _ in range(12)]
+
+    state.reset(seed=5)
+
+    assert (state.deck_len, state.climax_in_deck, state.ordered_cards) == (10, 3, 0)
+    assert state.waiting_room == waiting_room_template_for(config)
+    assert [state.draw()[0] for _ in range(12)] == first_draws
+
+
+def test_reveal_matches_repeated_draws():
+    config = DeckConfig(deck_cards=6, deck_climax_cards=2, waiting_room_cards=5, waiting_room_climax_cards=1)
+    for seed in range(30):
+        revealed = DeckState(config, random.Random(seed))
+        drawn = DeckState(config, random.Random(seed))
+        # An ordered top, an unordered remainder and a refresh within one reveal.
+        for state in (revealed, drawn):
+            state.deck = [False, True, False, False]
+            state.waiting_room = bytearray([1, 0, 0, 0, 0, 0, 1])
+            seed_top_stack(state, [False, True])
+
+        result = revealed.reveal(9)
+
+        cards = [drawn.draw() for _ in range(9)]
+        first_climax = next((index for index, (card, _) in enumerate(cards, 1) if card), 0)
+        climaxes = sum(card for card, _ in cards)
+        refreshes = sum(refreshed for _, refreshed in cards)
+        assert result == (first_climax, climaxes, refreshes)
+        assert (revealed.deck_len, revealed.climax_in_deck) == (drawn.deck_len, drawn.climax_in_deck)
+        assert revealed.waiting_room == drawn.waiting_room
+
+
+def test_reveal_within_unordered_deck_matches_repeated_draws():
+    config = DeckConfig(deck_cards=20, deck_climax_cards=6, waiting_room_cards=3, waiting_room_climax_cards=1)
+    for seed in range(30):
+        revealed = DeckState(config, random.Random(seed))
+        drawn = DeckState(config, random.Random(seed))
+
+        result = revealed.reveal(7)
+
+        cards = [drawn.draw()[0] for _ in range(7)]
+        first_climax = next((index for index, card in enumerate(cards, 1) if card), 0)
+        assert result == (first_climax, sum(cards), 0)
+        assert (revealed.deck_len, revealed.climax_in_deck) == (drawn.deck_len, drawn.climax_in_deck)
+        assert revealed.waiting_room == drawn.waiting_room
+
+
+def test_deck_reads_as_an_immutable_snapshot():
+    state = DeckState(DeckConfig(deck_cards=4, deck_climax_cards=1), random.Random(3))
+
+    with pytest.raises(AttributeError):
+        state.deck.pop()
+    state.deck = state.deck[:-1]
+
+    assert state.deck_len == 3
+
+
+def test_reassigning_attacking_rng_switches_streams():
+    reassigned = AttackingDeckState(deck_size=40, soul_trigger_cards=20, rng=random.Random(1))
+    reassigned.rng = random.Random(2)
+    fresh = AttackingDeckState(deck_size=40, soul_trigger_cards=20, rng=random.Random(2))
+
+    assert [reassigned.resolve_soul_trigger() for _ in range(30)] == [
+        fresh.resolve_soul_trigger() for _ in range(30)
+    ]
+
+
+def test_peeking_the_top_card_matches_the_next_draw():
+    config = DeckConfig(deck_cards=10, deck_climax_cards=5)
+    matches = []
+
+    def peek_top_card(state):
+        top_card = state.deck[-1]
+        matches.append(state.draw()[0] == top_card)
+        return 1 if top_card else 0
+
+    damages = simulate_trials([], config, trials=4000, seed=9, main_phase_steps=[peek_top_card])
+
+    assert all(matches)
+    assert math.isclose(np.count_nonzero(damages) / len(damages), 0.5, abs_tol=0.03)
+
+
+def test_draw_keeps_assigned_order_then_samples_remainder():
+    state = DeckState(DeckConfig(deck_cards=4, deck_climax_cards=2), random.Random(12))
+    assert state.ordered_cards == 0
+
+    state.deck = [False, True, False, True]
+    state.waiting_room = []
+    assert [state.draw()[0] for _ in range(4)] == [True, False, True, False]
+
+    card, refreshed = state.draw()
+    assert refreshed is True
+    assert state.ordered_cards == 0
+    assert state.deck_len + len(state.waiting_room) == 4
+    assert state.climax_in_deck + sum(state.waiting_room) == 2
+
+
+def test_count_draw_reveals_each_card_once():
+    config = DeckConfig(deck_cards=10, deck_climax_cards=3)
+    for seed in range(20):
+        state = DeckState(config, random.Random(seed))
+        revealed = [state.draw()[0] for _ in range(10)]
+        assert sum(revealed) == 3
+        assert state.deck_len == 0
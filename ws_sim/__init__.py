@@ -11,6 +11,7 @@ from .monte_carlo import (
     MagicStoneResult,
     apply_magic_stone_effect,
     cumulative_probability_at_least,
+    cumulative_probability_at_least_array,
     simulate_trials,
     tune_trial_count,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "MagicStoneResult",
     "apply_magic_stone_effect",
     "cumulative_probability_at_least",
+    "cumulative_probability_at_least_array",
     "simulate_trials",
     "tune_trial_count",
     "seed_top_stack",
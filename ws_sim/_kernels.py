@@ -0,0 +1,164 @@
+"""Numba-compiled trial kernels backing ``simulate_trials(..., backend="numba")``.
+
+Like :class:`~ws_sim.monte_carlo.DeckState`, each trial tracks its deck and
+waiting room as ``(cards, climaxes)`` counts: a draw reveals a climax with
+probability ``climaxes / cards`` and a refresh moves the waiting room counts
+back into the deck, so no card buffer is ever built or shuffled.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .monte_carlo import STEP_FOURTH_CANCEL_BONUS
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional dependency
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+# Trials sharing one RNG seed; blocks are the unit of parallel work.
+BLOCK_TRIALS = 1024
+
+
+def use_single_thread() -> None:
+    """Restrict Numba kernels in this process to one thread."""
+
+    if NUMBA_AVAILABLE:
+        from numba import set_num_threads
+
+        set_num_threads(1)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _draw(deck):
+        """Draw from ``deck = [deck_len, deck_climax, wr_len, wr_climax]``.
+
+        Returns ``(card, refreshed)``.
+        """
+
+        refreshed = 0
+        if deck[0] == 0:
+            deck[0] = deck[2]
+            deck[1] = deck[3]
+            deck[2] = 0
+            deck[3] = 0
+            refreshed = 1
+        card = 1 if np.random.random() * deck[0] < deck[1] else 0
+        deck[0] -= 1
+        deck[1] -= card
+        deck[2] += 1
+        deck[3] += card
+        return card, refreshed
+
+    @njit(cache=True)
+    def _resolve_damage(deck, damage):
+        """Return ``(dealt, refresh_penalty, cancel_position)``."""
+
+        cancel_position = 0
+        refresh_penalty = 0
+        for index in range(1, damage + 1):
+            card, refreshed = _draw(deck)
+            refresh_penalty += refreshed
+            if card and cancel_position == 0:
+                cancel_position = index
+        dealt = 0 if cancel_position else damage
+        return dealt, refresh_penalty, cancel_position
+
+    @njit(cache=True)
+    def _run_step(opcode, deck):
+        """Run a built-in main phase step and return its damage."""
+
+        if opcode == STEP_FOURTH_CANCEL_BONUS:
+            dealt, penalty, cancel_position = _resolve_damage(deck, 4)
+            total = dealt + penalty
+            if cancel_position == 4:
+                dealt, penalty, _ = _resolve_damage(deck, 4)
+                total += dealt + penalty
+            return total
+
+        total = 0
+        for _ in range(9):
+            card, refreshed = _draw(deck)
+            total += card + refreshed
+        return total
+
+    @njit(cache=True)
+    def _run_trial(
+        deck,
+        bases,
+        attacks,
+        steps,
+        deck_cards,
+        deck_climax_cards,
+        waiting_room_cards,
+        waiting_room_climax_cards,
+        attacking_deck_size,
+        attacking_soul_trigger_cards,
+    ):
+        deck[0] = deck_cards
+        deck[1] = deck_climax_cards
+        deck[2] = waiting_room_cards
+        deck[3] = waiting_room_climax_cards
+
+        total = 0
+        for opcode in steps:
+            total += _run_step(opcode, deck)
+
+        attack_size = attacking_deck_size
+        attack_triggers = attacking_soul_trigger_cards
+        for index in range(bases.size):
+            damage = bases[index]
+            if attacks[index] and attack_size > 0:
+                if np.random.randint(0, attack_size) < attack_triggers:
+                    attack_triggers -= 1
+                    damage += 1
+                attack_size -= 1
+            dealt, penalty, _ = _resolve_damage(deck, damage)
+            total += dealt + penalty
+        return total
+
+    @njit(cache=True, parallel=True)
+    def run_trials(
+        bases,
+        attacks,
+        steps,
+        deck_cards,
+        deck_climax_cards,
+        waiting_room_cards,
+        waiting_room_climax_cards,
+        attacking_deck_size,
+        attacking_soul_trigger_cards,
+        block_seeds,
+        trials,
+    ):
+        """Simulate ``trials`` battles, one RNG seed per block of trials.
+
+        ``attacking_deck_size`` is ``0`` when no attacking deck is modelled.
+        Seeding per block keeps results independent of thread scheduling.
+        """
+
+        results = np.empty(trials, dtype=np.int64)
+        for block in prange(block_seeds.size):
+            np.random.seed(block_seeds[block])
+            deck = np.empty(4, dtype=np.int64)
+            start = block * BLOCK_TRIALS
+            stop = min(start + BLOCK_TRIALS, trials)
+            for trial in range(start, stop):
+                results[trial] = _run_trial(
+                    deck,
+                    bases,
+                    attacks,
+                    steps,
+                    deck_cards,
+                    deck_climax_cards,
+                    waiting_room_cards,
+                    waiting_room_climax_cards,
+                    attacking_deck_size,
+                    attacking_soul_trigger_cards,
+                )
+        return results
@@ -0,0 +1,67 @@
+"""Closed-form damage distributions for the built-in main phase steps.
+
+These apply while the deck holds enough cards for the step to resolve without
+a refresh, where the outcome depends only on the deck composition.
+"""
+
+from __future__ import annotations
+
+from math import comb
+from typing import Mapping
+
+
+def _validate_deck(deck_cards: int, climax_cards: int, min_cards: int) -> None:
+    if climax_cards < 0:
+        raise ValueError("climax_cards cannot be negative")
+    if climax_cards > deck_cards:
+        raise ValueError("climax_cards cannot exceed deck_cards")
+    if deck_cards < min_cards:
+        raise ValueError(f"deck_cards must be at least {min_cards} to avoid a refresh")
+
+
+def p_no_cancel(deck_cards: int, climax_cards: int, damage: int) -> float:
+    """Probability that ``damage`` revealed cards contain no climax."""
+
+    _validate_deck(deck_cards, climax_cards, damage)
+    return comb(deck_cards - climax_cards, damage) / comb(deck_cards, damage)
+
+
+def p_fourth_cancel(deck_cards: int, climax_cards: int) -> float:
+    """Probability that the first climax of a 4-damage reveal is the fourth card."""
+
+    _validate_deck(deck_cards, climax_cards, 4)
+    non_climax = deck_cards - climax_cards
+    return (
+        non_climax * (non_climax - 1) * (non_climax - 2) * climax_cards
+    ) / (deck_cards * (deck_cards - 1) * (deck_cards - 2) * (deck_cards - 3))
+
+
+def fourth_cancel_bonus_damage_distribution(
+    deck_cards: int, climax_cards: int
+) -> Mapping[int, float]:
+    """Damage distribution of :func:`~ws_sim.monte_carlo.main_phase_fourth_cancel_bonus_damage`.
+
+    Requires at least 8 cards so neither reveal can trigger a refresh.
+    """
+
+    _validate_deck(deck_cards, climax_cards, 8)
+    p_four = p_no_cancel(deck_cards, climax_cards, 4)
+    p_four += p_fourth_cancel(deck_cards, climax_cards) * p_no_cancel(
+        deck_cards - 4, climax_cards - 1, 4
+    )
+    return {0: 1.0 - p_four, 4: p_four}
+
+
+def reveal_nine_clock_distribution(deck_cards: int, climax_cards: int) -> Mapping[int, float]:
+    """Damage distribution of :func:`~ws_sim.monte_carlo.reveal_nine_clock_climaxes`.
+
+    The clocked damage is the hypergeometric count of climaxes in the top 9
+    cards; requires at least 9 cards so the reveal cannot refresh.
+    """
+
+    _validate_deck(deck_cards, climax_cards, 9)
+    total = comb(deck_cards, 9)
+    return {
+        climaxes: comb(climax_cards, climaxes) * comb(deck_cards - climax_cards, 9 - climaxes) / total
+        for climaxes in range(min(climax_cards, 9) + 1)
+    }
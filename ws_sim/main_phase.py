@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable, Mapping, MutableSequence, Sequence
+from typing import Iterable, Mapping, Sequence, Tuple
+
+import numpy as np
 
 from .monte_carlo import (
     DamageEvent,
@@ -11,45 +13,63 @@ from .monte_carlo import (
 )
 
 
+def _top_stack_bits(top_stack: Sequence[bool]) -> Tuple[int, int, int]:
+    """Return ``(size, climax_count, bits)`` for a top-to-bottom ``top_stack``.
+
+    Bit ``i`` of ``bits`` marks the ``i``-th card from the bottom of the stack,
+    matching the layout of :attr:`DeckState.top_mask`.
+    """
+
+    bits = 0
+    for index, card in enumerate(reversed(top_stack)):
+        if card:
+            bits |= 1 << index
+    return len(top_stack), bits.bit_count(), bits
+
+
+def _place_top_stack(deck_state: DeckState, top_size: int, top_climax: int, top_bits: int) -> None:
+    total_climax_in_deck = deck_state.climax_in_deck
+    if top_size > deck_state.deck_len:
+        raise ValueError("Top stack longer than current deck")
+
+    remainder_size = deck_state.deck_len - top_size
+    remainder_climax = total_climax_in_deck - top_climax
+    if remainder_climax < 0 or remainder_climax > remainder_size:
+        raise ValueError("Top stack uses more climax cards than available in deck")
+
+    deck_state.top_mask = top_bits
+    deck_state.ordered_cards = top_size
+
+
 def seed_top_stack(deck_state: DeckState, top_stack: Sequence[bool]) -> int:
     """Place a known ``top_stack`` on top of the current deck.
 
     The provided ``top_stack`` should be ordered from top to bottom using
     boolean values where ``True`` marks a climax card. The function preserves
-    overall deck composition, shuffling the remainder with the deck's RNG.
+    overall deck composition; the remainder below the stack stays unordered and
+    is drawn uniformly at random by :meth:`DeckState.draw`.
 
     Returns the amount of damage dealt, which is always ``0`` so the helper can
     be slotted directly into ``main_phase_steps``.
     """
 
-    total_climax_in_deck = sum(deck_state.deck)
-    top_size = len(top_stack)
-    if top_size > len(deck_state.deck):
-        raise ValueError("Top stack longer than current deck")
-
-    top_climax = sum(top_stack)
-    remainder_size = len(deck_state.deck) - top_size
-    remainder_climax = total_climax_in_deck - top_climax
-    if remainder_climax < 0 or remainder_climax > remainder_size:
-        raise ValueError("Top stack uses more climax cards than available in deck")
-
-    remainder: MutableSequence[bool] = [True] * remainder_climax + [
-        False
-    ] * (remainder_size - remainder_climax)
-    deck_state.rng.shuffle(remainder)
-    deck_state.deck = remainder + list(reversed(top_stack))
+    _place_top_stack(deck_state, *_top_stack_bits(top_stack))
     return 0
 
 
 def apply_seeded_top_stack(top_stack: Sequence[bool]) -> MainPhaseStep:
     """Wrap :func:`seed_top_stack` for use in ``main_phase_steps``.
 
-    The returned callable captures ``top_stack`` so it can be reused across
-    simulations without mutating the source list.
+    The returned callable captures a snapshot of ``top_stack`` (already packed
+    into deck bits) so it can be reused across simulations without mutating
+    the source list or re-reading it every trial.
     """
 
+    top_size, top_climax, top_bits = _top_stack_bits(top_stack)
+
     def _apply(deck_state: DeckState) -> int:
-        return seed_top_stack(deck_state, top_stack)
+        _place_top_stack(deck_state, top_size, top_climax, top_bits)
+        return 0
 
     return _apply
 
@@ -61,7 +81,7 @@ def run_main_phase_and_battle(
     main_phase_steps: Iterable[MainPhaseStep] | None = None,
     trials: int,
     seed: int | None = None,
-) -> list[int]:
+) -> np.ndarray:
     """Simulate the full main phase and battle flow in one call."""
 
     return simulate_trials(
@@ -80,10 +100,10 @@ def run_main_phase_scenarios(
     *,
     trials: int,
     seed: int | None = None,
-) -> Mapping[str, list[int]]:
+) -> Mapping[str, np.ndarray]:
     """Execute multiple named ``main_phase_steps`` scenarios.
 
-    Returns a mapping of scenario labels to the damage lists produced by
+    Returns a mapping of scenario labels to the damage arrays produced by
     :func:`run_main_phase_and_battle`, allowing callers to reuse battle
     sequences across multiple pre-battle manipulations.
     """
@@ -1,8 +1,70 @@
 from __future__ import annotations
 
+import math
+import multiprocessing
+import os
+import pickle
 import random
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Callable, Iterable, List, Mapping, MutableSequence, Sequence, Tuple
+from functools import lru_cache
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from . import analytic
+
+RNG_BACKENDS = ("stdlib", "numpy")
+
+# Either RNG can drive the per-trial simulation; see ``DeckConfig.rng_backend``.
+TrialRng = Union[random.Random, np.random.Generator]
+
+
+def make_rng(rng_backend: str, seed: int | None = None) -> TrialRng:
+    """Create the per-trial RNG selected by ``DeckConfig.rng_backend``."""
+    if rng_backend == "numpy":
+        return np.random.default_rng(seed)
+    return random.Random(seed)
+
+
+# Re-check the pile totals on every refresh; skipped under ``python -O``.
+_VALIDATE = __debug__
+
+# Uniforms prefetched per ``Generator.random`` call by :func:`_uniform_source`.
+_UNIFORM_BLOCK = 4096
+
+
+def _uniform_source(rng: TrialRng) -> Callable[[], float]:
+    """Return a zero-argument ``[0, 1)`` sampler drawing from ``rng``.
+
+    A NumPy ``Generator`` costs far more per scalar call than
+    ``random.Random``, so its output is prefetched in blocks and handed out
+    one value at a time; the values come from the same PCG64 stream.
+    """
+
+    if not isinstance(rng, np.random.Generator):
+        return rng.random
+    buffer: List[float] = []
+
+    def uniform() -> float:
+        if not buffer:
+            # Reversed so ``pop`` hands values out in generator order.
+            buffer.extend(rng.random(_UNIFORM_BLOCK)[::-1].tolist())
+        return buffer.pop()
+
+    return uniform
 
 
 @dataclass(frozen=True)
@@ -13,6 +75,10 @@ class DeckConfig:
     Waiting room counts (either ``initial_waiting_room_*`` or
     ``waiting_room_*`` overrides) are added on top of the deck rather than
     being subtracted from it, so they represent cards already milled/clocked.
+
+    ``rng_backend`` picks the RNG for the ``"python"`` simulation backend:
+    ``"stdlib"`` (``random.Random``, the default) or ``"numpy"``
+    (``numpy.random.Generator`` with PCG64).
     """
     deck_cards: int
     deck_climax_cards: int
@@ -22,6 +88,7 @@ class DeckConfig:
     waiting_room_climax_cards: int = 0
     attacking_deck_size: int | None = None
     attacking_soul_trigger_cards: int = 0
+    rng_backend: str = "stdlib"
 
     def __post_init__(self) -> None:
         if self.deck_cards <= 0:
@@ -53,6 +120,8 @@ class DeckConfig:
                 raise ValueError("attacking_soul_trigger_cards cannot be negative")
             if self.attacking_soul_trigger_cards > self.attacking_deck_size:
                 raise ValueError("attacking_soul_trigger_cards cannot exceed attacking_deck_size")
+        if self.rng_backend not in RNG_BACKENDS:
+            raise ValueError(f"rng_backend must be one of {RNG_BACKENDS}")
 
     @property
     def starting_waiting_room(self) -> Tuple[int, int]:
@@ -62,62 +131,249 @@ class DeckConfig:
         return self.initial_waiting_room_cards, self.initial_waiting_room_climax_cards
 
 
+def waiting_room_template_for(config: DeckConfig) -> bytes:
+    """Return the starting waiting room of ``config`` as an immutable pile.
+
+    Each byte is one card: ``1`` for a climax, ``0`` otherwise.
+    """
+    waiting_room_cards, waiting_room_climax_cards = config.starting_waiting_room
+    non_climax_cards = waiting_room_cards - waiting_room_climax_cards
+    return b"\x01" * waiting_room_climax_cards + bytes(non_climax_cards)
+
+
 class DeckState:
-    def __init__(self, config: DeckConfig, rng: random.Random) -> None:
+    """Mutable deck and waiting room for a single trial.
+
+    Only the climax / non-climax distinction of a card matters, so the deck is
+    stored as counts: ``deck_len`` cards of which ``climax_in_deck`` are
+    climaxes. The deck is never shuffled; each :meth:`draw` reveals a climax
+    with probability ``climaxes / cards`` over the undrawn cards, which is the
+    same as drawing the top card of a uniformly shuffled deck.
+
+    The top ``ordered_cards`` cards may instead have a fixed order, packed into
+    ``top_mask`` (bit ``i`` is set when the ``i``-th ordered card from the
+    bottom is a climax, so the next card drawn is the highest bit). Assigning
+    :attr:`deck` fixes the order of every card; :func:`~ws_sim.main_phase.seed_top_stack`
+    fixes only the top few. Reading :attr:`deck` fixes a random order for
+    the rest so peeked cards are the ones drawn next. :attr:`deck` reads as a
+    tuple, so assigning ``state.deck = ...`` is the only supported way to
+    change the deck's cards.
+
+    The waiting room is a ``bytearray`` with one byte per card (``1`` for a
+    climax), left unshuffled because a refresh reshuffles it anyway. Plain
+    lists of booleans may also be assigned to it.
+    ``waiting_room_template`` lets callers building many states share one
+    prebuilt starting pile (see :func:`waiting_room_template_for`), and
+    :meth:`reset` returns a state to that starting position so one instance
+    can be reused across trials.
+    """
+
+    __slots__ = (
+        "config",
+        "_rng",
+        "_uniform",
+        "_waiting_room_template",
+        "waiting_room",
+        "deck_len",
+        "climax_in_deck",
+        "ordered_cards",
+        "top_mask",
+        "total_cards",
+        "total_climax_cards",
+    )
+
+    def __init__(
+        self,
+        config: DeckConfig,
+        rng: TrialRng,
+        waiting_room_template: Sequence[int] | None = None,
+    ) -> None:
         self.config = config
         self.rng = rng
         waiting_room_cards, waiting_room_climax_cards = config.starting_waiting_room
         deck_size = config.deck_cards
         deck_climax_cards = config.deck_climax_cards
 
-        self.waiting_room: MutableSequence[bool] = self._build_shuffled_pile(
-            waiting_room_cards, waiting_room_climax_cards
-        )
-        self.deck: MutableSequence[bool] = self._build_shuffled_pile(deck_size, deck_climax_cards)
+        if waiting_room_template is None:
+            waiting_room_template = waiting_room_template_for(config)
+        self._waiting_room_template = waiting_room_template
+        self.waiting_room: MutableSequence[int] = bytearray(waiting_room_template)
+        self.deck_len = deck_size
+        self.climax_in_deck = deck_climax_cards
+        self.ordered_cards = 0
+        self.top_mask = 0
         self.total_cards = deck_size + waiting_room_cards
         self.total_climax_cards = deck_climax_cards + waiting_room_climax_cards
-        self._validate_state(deck_size, deck_climax_cards, waiting_room_cards, waiting_room_climax_cards)
+        self._validate_state(len(self.waiting_room), self.waiting_room.count(1))
 
-    def _build_shuffled_pile(self, size: int, climax_cards: int) -> MutableSequence[bool]:
-        pile = [True] * climax_cards + [False] * (size - climax_cards)
-        self.rng.shuffle(pile)
-        return pile
+    @property
+    def rng(self) -> TrialRng:
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: TrialRng) -> None:
+        self._rng = rng
+        self._uniform = _uniform_source(rng)
+
+    def reset(self, seed: int | None = None) -> None:
+        """Restore the starting deck and waiting room for a new trial.
+
+        When ``seed`` is given the RNG is replaced by a fresh one from
+        :func:`make_rng`; otherwise the current stream simply continues. Other
+        states that shared the old RNG, such as an :class:`AttackingDeckState`,
+        keep drawing from it until they are given ``deck_state.rng``.
+        """
+
+        config = self.config
+        if seed is not None:
+            self.rng = make_rng(config.rng_backend, seed)
+        self.waiting_room = bytearray(self._waiting_room_template)
+        self.deck_len = config.deck_cards
+        self.climax_in_deck = config.deck_climax_cards
+        self.ordered_cards = 0
+        self.top_mask = 0
 
-    def _validate_state(
-        self,
-        expected_deck_cards: int,
-        expected_deck_climax_cards: int,
-        expected_waiting_cards: int,
-        expected_waiting_climax_cards: int,
-    ) -> None:
-        total_cards = len(self.deck) + len(self.waiting_room)
-        total_climax_cards = sum(self.deck) + sum(self.waiting_room)
-        if total_cards != self.total_cards or total_climax_cards != self.total_climax_cards:
+    @property
+    def deck(self) -> Tuple[bool, ...]:
+        """Deck contents ordered bottom to top (the last element is drawn next).
+
+        Reading the deck first fixes a random order for any unordered cards
+        (see :meth:`_fix_order`), so later draws reveal exactly the cards seen.
+        The result is a read-only snapshot; assign a new sequence to
+        :attr:`deck` to change the deck.
+        """
+        self._fix_order()
+        top_mask = self.top_mask
+        return tuple(bool(top_mask >> index & 1) for index in range(self.deck_len))
+
+    @deck.setter
+    def deck(self, cards: Sequence[bool]) -> None:
+        mask = 0
+        for index, card in enumerate(cards):
+            if card:
+                mask |= 1 << index
+        self.top_mask = mask
+        self.deck_len = len(cards)
+        self.ordered_cards = len(cards)
+        self.climax_in_deck = mask.bit_count()
+
+    def _fix_order(self) -> None:
+        """Order the cards below the ordered top uniformly at random.
+
+        The cards are sampled top-down from the trial RNG exactly as
+        :meth:`draw` would reveal them, then packed under the ordered top so
+        the whole deck becomes ordered.
+        """
+        unordered_cards = self.deck_len - self.ordered_cards
+        if not unordered_cards:
+            return
+        climax_left = self.climax_in_deck - self.top_mask.bit_count()
+        uniform = self._uniform
+        bits = 0
+        for position in range(unordered_cards - 1, -1, -1):
+            if uniform() * (position + 1) < climax_left:
+                climax_left -= 1
+                bits |= 1 << position
+        self.top_mask = self.top_mask << unordered_cards | bits
+        self.ordered_cards = self.deck_len
+
+    def _validate_state(self, waiting_cards: int, waiting_climax_cards: int) -> None:
+        """Check the deck counts plus the given waiting room counts against the totals."""
+        if (
+            self.deck_len + waiting_cards != self.total_cards
+            or self.climax_in_deck + waiting_climax_cards != self.total_climax_cards
+        ):
             raise ValueError("Deck and waiting room composition does not match configuration")
-        if len(self.deck) != expected_deck_cards or sum(self.deck) != expected_deck_climax_cards:
-            raise ValueError("Deck composition does not match configuration")
-        if len(self.waiting_room) != expected_waiting_cards or sum(self.waiting_room) != expected_waiting_climax_cards:
-            raise ValueError("Waiting room composition does not match configuration")
+
+    def _refresh(self) -> None:
+        """Turn the waiting room into the new (unordered) deck."""
+        refreshed_cards = len(self.waiting_room)
+        refreshed_climax_cards = self.waiting_room.count(1)
+        self.deck_len = refreshed_cards
+        self.climax_in_deck = refreshed_climax_cards
+        self.ordered_cards = 0
+        self.top_mask = 0
+        self.waiting_room = bytearray()
+        if _VALIDATE:
+            self._validate_state(0, 0)
 
     def draw(self) -> Tuple[bool, bool]:
         refresh_damage = False
-        if not self.deck:
-            # Refresh: shuffle the waiting room back into a deck.
-            self.deck = list(self.waiting_room)
-            self.waiting_room = []
-            self.rng.shuffle(self.deck)
+        if not self.deck_len:
+            self._refresh()
             refresh_damage = True
-            self._validate_state(
-                expected_deck_cards=len(self.deck),
-                expected_deck_climax_cards=sum(self.deck),
-                expected_waiting_cards=len(self.waiting_room),
-                expected_waiting_climax_cards=sum(self.waiting_room),
-            )
 
-        card = self.deck.pop()
+        if self.ordered_cards:
+            self.ordered_cards -= 1
+            top_bit = 1 << self.ordered_cards
+            card = self.top_mask & top_bit != 0
+            if card:
+                self.top_mask ^= top_bit
+        else:
+            card = self._uniform() * self.deck_len < self.climax_in_deck
+        self.deck_len -= 1
+        if card:
+            self.climax_in_deck -= 1
         self.waiting_room.append(card)
         return card, refresh_damage
 
+    def reveal(self, count: int) -> Tuple[int, int, int]:
+        """Draw ``count`` cards and return ``(first_climax, climaxes, refreshes)``.
+
+        ``first_climax`` is the 1-based position of the first climax revealed,
+        or ``0`` if none was. Equivalent to calling :meth:`draw` ``count``
+        times, but unordered draws update the deck counts in locals and write
+        them back once instead of returning a tuple per card.
+        """
+
+        first_climax = climaxes = refreshes = 0
+        deck_len = self.deck_len
+        climax_in_deck = self.climax_in_deck
+        ordered_cards = self.ordered_cards
+        uniform = self._uniform
+        append = self.waiting_room.append
+        if not ordered_cards and count <= deck_len:
+            # The usual case: the reveal can neither refresh nor reach an
+            # ordered card, so no per-card checks are needed.
+            for index in range(1, count + 1):
+                if uniform() * deck_len < climax_in_deck:
+                    climax_in_deck -= 1
+                    append(1)
+                    climaxes += 1
+                    if not first_climax:
+                        first_climax = index
+                else:
+                    append(0)
+                deck_len -= 1
+            self.deck_len = deck_len
+            self.climax_in_deck = climax_in_deck
+            return first_climax, climaxes, 0
+
+        for index in range(1, count + 1):
+            if deck_len and not ordered_cards:
+                card = uniform() * deck_len < climax_in_deck
+                deck_len -= 1
+                if card:
+                    climax_in_deck -= 1
+                append(card)
+            else:
+                # Ordered top cards and refreshes take the general path.
+                self.deck_len = deck_len
+                self.climax_in_deck = climax_in_deck
+                card, refreshed = self.draw()
+                refreshes += refreshed
+                deck_len = self.deck_len
+                climax_in_deck = self.climax_in_deck
+                ordered_cards = self.ordered_cards
+                append = self.waiting_room.append
+            if card:
+                climaxes += 1
+                if not first_climax:
+                    first_climax = index
+        self.deck_len = deck_len
+        self.climax_in_deck = climax_in_deck
+        return first_climax, climaxes, refreshes
+
 
 @dataclass(frozen=True)
 class MagicStoneResult:
@@ -180,16 +436,32 @@ def apply_magic_stone_effect(
 
 
 class AttackingDeckState:
-    def __init__(self, deck_size: int, soul_trigger_cards: int, rng: random.Random) -> None:
+    __slots__ = ("_starting_counts", "deck_size", "soul_trigger_cards", "_rng", "_uniform")
+
+    def __init__(self, deck_size: int, soul_trigger_cards: int, rng: TrialRng) -> None:
+        self._starting_counts = (deck_size, soul_trigger_cards)
         self.deck_size = deck_size
         self.soul_trigger_cards = soul_trigger_cards
         self.rng = rng
 
+    @property
+    def rng(self) -> TrialRng:
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: TrialRng) -> None:
+        self._rng = rng
+        self._uniform = _uniform_source(rng)
+
+    def reset(self) -> None:
+        """Restore the starting deck counts for a new trial."""
+        self.deck_size, self.soul_trigger_cards = self._starting_counts
+
     def resolve_soul_trigger(self) -> bool:
         if self.deck_size == 0:
             return False
 
-        trigger_hit = self.rng.randrange(self.deck_size) < self.soul_trigger_cards
+        trigger_hit = self._uniform() * self.deck_size < self.soul_trigger_cards
         self.deck_size -= 1
         if trigger_hit:
             self.soul_trigger_cards -= 1
@@ -197,7 +469,7 @@ class AttackingDeckState:
 
 
 def _build_attacking_deck(
-    deck_config: DeckConfig, rng: random.Random
+    deck_config: DeckConfig, rng: TrialRng
 ) -> AttackingDeckState | None:
     if deck_config.attacking_deck_size is None:
         return None
@@ -220,17 +492,10 @@ def _resolve_damage_event(
     the first cancelling card (or ``None`` if no cancel occurred).
     """
 
-    cancelled = False
-    cancel_position: int | None = None
-    refresh_penalty = 0
-    for index in range(1, damage + 1):
-        card, refreshed = deck_state.draw()
-        if refreshed:
-            refresh_penalty += 1
-        if card and not cancelled:
-            cancelled = True
-            cancel_position = index
-    return (0 if cancelled else damage), refresh_penalty, cancelled, cancel_position
+    first_climax, _, refresh_penalty = deck_state.reveal(damage)
+    if first_climax:
+        return 0, refresh_penalty, True, first_climax
+    return damage, refresh_penalty, False, None
 
 
 def _resolve_attack_trigger(attacking_state: AttackingDeckState | None) -> bool:
@@ -267,6 +532,296 @@ def _normalize_damage_event(raw_damage: int | DamageEvent) -> DamageEvent:
 
 MainPhaseStep = Callable[[DeckState], int]
 
+DamageKernel = Callable[[Callable[[int], Tuple[int, int, int]], Optional[Callable[[], bool]]], int]
+
+
+@lru_cache(maxsize=128)
+def _compile_damage_kernel(
+    events: Tuple[Tuple[int, bool], ...], with_triggers: bool
+) -> DamageKernel:
+    """Generate a battle resolver specialised for one damage sequence.
+
+    ``events`` holds ``(base_damage, is_attack)`` pairs. The generated
+    ``kernel(reveal, trigger)`` takes :meth:`DeckState.reveal` and unrolls every
+    event, so the per-trial loop does no event iteration or type dispatch. It
+    consumes the RNG in the same order as :func:`_simulate_attack` /
+    :func:`_resolve_damage_event` (trigger check, then draws), so seeded results
+    are unchanged.
+    """
+
+    lines = ["def kernel(reveal, trigger):", "    total = 0"]
+    for base_damage, is_attack in events:
+        if is_attack and with_triggers:
+            lines.append(f"    damage = {base_damage} + trigger()")
+            lines.append("    cancel, _, refreshes = reveal(damage)")
+            lines.append("    total += refreshes if cancel else damage + refreshes")
+        elif base_damage:
+            lines.append(f"    cancel, _, refreshes = reveal({base_damage})")
+            lines.append(f"    total += refreshes if cancel else {base_damage} + refreshes")
+    lines.append("    return total")
+
+    namespace: dict = {}
+    exec(compile("\n".join(lines), "<damage-kernel>", "exec"), namespace)
+    return namespace["kernel"]
+
+
+SIMULATION_BACKENDS = ("python", "numpy", "numba")
+
+# Element type of the per-trial damage arrays returned by ``simulate_trials``.
+DAMAGE_DTYPE = np.int32
+
+# Trials resolved per vectorized batch; keeps the NumPy backend's per-trial
+# count arrays cache-sized.
+_NUMPY_BATCH_TRIALS = 1 << 16
+
+# Opcodes for the built-in main phase steps the NumPy and Numba backends run
+# natively. Kept here so the NumPy backend never has to import numba.
+STEP_FOURTH_CANCEL_BONUS = 0
+STEP_REVEAL_NINE_CLOCK = 1
+
+
+class _BatchDeckState:
+    """Vectorized :class:`DeckState` holding one row of card counts per trial."""
+
+    def __init__(self, deck_config: DeckConfig, trials: int, rng: np.random.Generator) -> None:
+        waiting_room_cards, waiting_room_climax_cards = deck_config.starting_waiting_room
+        self.rng = rng
+        self.trials = trials
+        self.deck_len = np.full(trials, deck_config.deck_cards, dtype=np.int64)
+        self.climax_in_deck = np.full(trials, deck_config.deck_climax_cards, dtype=np.int64)
+        self.waiting_room_len = np.full(trials, waiting_room_cards, dtype=np.int64)
+        self.waiting_room_climax = np.full(trials, waiting_room_climax_cards, dtype=np.int64)
+        self.refreshes = np.zeros(trials, dtype=np.int64)
+
+    def draw(self, active: np.ndarray | None = None) -> np.ndarray:
+        """Draw one card in every trial (or only where ``active``); return the climax mask."""
+
+        empty = self.deck_len == 0
+        if active is not None:
+            empty &= active
+        if empty.any():
+            self.deck_len[empty] = self.waiting_room_len[empty]
+            self.climax_in_deck[empty] = self.waiting_room_climax[empty]
+            self.waiting_room_len[empty] = 0
+            self.waiting_room_climax[empty] = 0
+            self.refreshes += empty
+
+        hit = self.rng.random(self.trials) * self.deck_len < self.climax_in_deck
+        drawn = 1 if active is None else active
+        if active is not None:
+            hit &= active
+        self.deck_len -= drawn
+        self.climax_in_deck -= hit
+        self.waiting_room_len += drawn
+        self.waiting_room_climax += hit
+        return hit
+
+    def resolve_damage(
+        self, damage: int | np.ndarray, active: np.ndarray | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized :func:`_resolve_damage_event` without refresh penalties.
+
+        Returns ``(damage_dealt, cancel_position)`` with ``0`` marking no cancel.
+        """
+
+        cancel_position = np.zeros(self.trials, dtype=np.int64)
+        for index in range(1, int(np.max(damage)) + 1):
+            revealing = active
+            if isinstance(damage, np.ndarray):
+                revealing = damage >= index if active is None else (damage >= index) & active
+            hit = self.draw(revealing)
+            cancel_position[hit & (cancel_position == 0)] = index
+        dealt = np.where(cancel_position == 0, damage, 0)
+        if active is not None:
+            dealt = np.where(active, dealt, 0)
+        return dealt, cancel_position
+
+
+def _fourth_cancel_bonus_damage_batch(state: _BatchDeckState) -> np.ndarray:
+    """Vectorized :func:`main_phase_fourth_cancel_bonus_damage` without refresh penalties."""
+
+    dealt, cancel_position = state.resolve_damage(4)
+    fourth_cancels = cancel_position == 4
+    if fourth_cancels.any():
+        followup_dealt, _ = state.resolve_damage(4, fourth_cancels)
+        dealt = dealt + followup_dealt
+    return dealt
+
+
+def _simulate_batch_numpy(
+    bases: np.ndarray,
+    attacks: np.ndarray,
+    deck_config: DeckConfig,
+    trials: int,
+    rng: np.random.Generator,
+    step_opcodes: Sequence[int] = (),
+) -> np.ndarray:
+    """Resolve ``trials`` battles at once, one vectorized draw per revealed card.
+
+    Each trial's deck and waiting room are tracked as climax counts (see
+    :class:`DeckState`), so a draw across every trial is one uniform sample per
+    trial compared against ``climaxes / cards``. Refresh penalties are counted
+    as the decks run out and added at the end. Built-in main phase steps
+    (given as ``step_opcodes``) run before battle damage.
+    """
+
+    state = _BatchDeckState(deck_config, trials, rng)
+    totals = np.zeros(trials, dtype=np.int64)
+    if step_opcodes:
+        for opcode in step_opcodes:
+            if opcode == STEP_FOURTH_CANCEL_BONUS:
+                totals += _fourth_cancel_bonus_damage_batch(state)
+            else:
+                for _ in range(9):
+                    totals += state.draw()
+
+    attack_deck_size = deck_config.attacking_deck_size
+    if attack_deck_size is not None:
+        attack_size = np.full(trials, attack_deck_size, dtype=np.int64)
+        attack_triggers = np.full(trials, deck_config.attacking_soul_trigger_cards, dtype=np.int64)
+    for base, is_attack in zip(bases.tolist(), attacks.tolist()):
+        damage: int | np.ndarray = base
+        if is_attack and attack_deck_size is not None:
+            triggered = rng.random(trials) * attack_size < attack_triggers
+            attack_size -= attack_size > 0
+            attack_triggers -= triggered
+            damage = base + triggered
+        dealt, _ = state.resolve_damage(damage)
+        totals += dealt
+
+    return totals + state.refreshes
+
+
+def _simulate_trials_numpy(
+    base_damages: Sequence[int],
+    attack_flags: Sequence[bool],
+    deck_config: DeckConfig,
+    trials: int,
+    seed: int | None,
+    step_opcodes: Sequence[int] = (),
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    bases = np.array(base_damages, dtype=np.int64)
+    attacks = np.array(attack_flags, dtype=bool)
+
+    results = np.empty(trials, dtype=DAMAGE_DTYPE)
+    for start in range(0, trials, _NUMPY_BATCH_TRIALS):
+        batch = min(_NUMPY_BATCH_TRIALS, trials - start)
+        results[start : start + batch] = _simulate_batch_numpy(
+            bases, attacks, deck_config, batch, rng, step_opcodes
+        )
+    return results
+
+
+def _simulate_trials_numba(
+    base_damages: Sequence[int],
+    attack_flags: Sequence[bool],
+    step_opcodes: Sequence[int],
+    deck_config: DeckConfig,
+    trials: int,
+    seed: int | None,
+) -> np.ndarray:
+    from . import _kernels
+
+    if not _kernels.NUMBA_AVAILABLE:
+        raise ImportError("backend='numba' requires the optional numba package")
+
+    waiting_room_cards, waiting_room_climax_cards = deck_config.starting_waiting_room
+    blocks = -(-trials // _kernels.BLOCK_TRIALS)
+    block_seeds = np.random.SeedSequence(seed).generate_state(blocks).astype(np.int64)
+    results = _kernels.run_trials(
+        np.array(base_damages, dtype=np.int64),
+        np.array(attack_flags, dtype=np.bool_),
+        np.array(step_opcodes, dtype=np.int64),
+        deck_config.deck_cards,
+        deck_config.deck_climax_cards,
+        waiting_room_cards,
+        waiting_room_climax_cards,
+        deck_config.attacking_deck_size or 0,
+        deck_config.attacking_soul_trigger_cards,
+        block_seeds,
+        trials,
+    )
+    return results.astype(DAMAGE_DTYPE)
+
+
+def _run_chunk(
+    damage_events: Sequence[int | DamageEvent],
+    deck_config: DeckConfig,
+    trials: int,
+    seed: int,
+    main_phase_steps: Sequence[MainPhaseStep],
+    backend: str,
+) -> np.ndarray:
+    """Worker entry point for :func:`simulate_trials` with ``workers > 1``."""
+
+    if backend == "numba":
+        from . import _kernels
+
+        # The pool already spreads work across processes; nested Numba thread
+        # pools would oversubscribe the CPUs.
+        _kernels.use_single_thread()
+    return simulate_trials(
+        damage_events,
+        deck_config,
+        trials=trials,
+        seed=seed,
+        main_phase_steps=main_phase_steps,
+        backend=backend,
+    )
+
+
+def _is_picklable(value: object) -> bool:
+    try:
+        pickle.dumps(value)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _make_trial_pool(workers: int) -> ProcessPoolExecutor:
+    """Start a process pool for :func:`simulate_trials` chunks."""
+
+    # The chunking (and so the results) depends only on ``workers``; the pool
+    # itself never outgrows the machine.
+    pool_size = min(workers, os.cpu_count() or 1)
+    # Spawn rather than fork: forking after Numba's threading layer has started
+    # leaves the parent unable to shut down cleanly.
+    return ProcessPoolExecutor(
+        max_workers=pool_size, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _simulate_trials_parallel(
+    damage_events: Sequence[int | DamageEvent],
+    deck_config: DeckConfig,
+    trials: int,
+    seed: int | None,
+    main_phase_steps: Sequence[MainPhaseStep],
+    backend: str,
+    workers: int,
+    executor: Executor | None = None,
+) -> np.ndarray:
+    chunk_sizes = [
+        trials // workers + (1 if index < trials % workers else 0) for index in range(workers)
+    ]
+    chunk_sizes = [size for size in chunk_sizes if size]
+    chunk_seeds = [
+        int(child.generate_state(1)[0])
+        for child in np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    ]
+
+    # A caller-owned executor is borrowed, not shut down.
+    pool = _make_trial_pool(len(chunk_sizes)) if executor is None else nullcontext(executor)
+    with pool as executor:
+        futures = [
+            executor.submit(
+                _run_chunk, damage_events, deck_config, size, chunk_seed, main_phase_steps, backend
+            )
+            for size, chunk_seed in zip(chunk_sizes, chunk_seeds)
+        ]
+        return np.concatenate([future.result() for future in futures])
+
 
 def simulate_trials(
     damage_sequence: Sequence[int | DamageEvent],
@@ -274,9 +829,15 @@ def simulate_trials(
     trials: int,
     seed: int | None = None,
     main_phase_steps: Iterable[MainPhaseStep] | None = None,
-) -> List[int]:
+    backend: str = "python",
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> np.ndarray:
     """Run Monte Carlo trials for a battle damage sequence.
 
+    Returns the total damage of every trial as a ``DAMAGE_DTYPE`` (``int32``)
+    array; use ``.tolist()`` where a plain list is needed.
+
     ``damage_sequence`` accepts either integers (for backwards compatibility)
     or :class:`DamageEvent` instances. Attack damage routes through
     :func:`_simulate_attack`, while effect damage bypasses attack-only trigger
@@ -287,7 +848,9 @@ def simulate_trials(
     the immediate damage it dealt (including any refresh penalty it generated)
     before battle attacks resolve. Steps are responsible for calling
     :func:`_resolve_damage_event` (or helpers built on it) when cancellable
-    damage is needed.
+    damage is needed. Steps may read ``deck_state.deck`` (a tuple) but must
+    assign ``deck_state.deck = ...`` to change it; in-place edits of the
+    returned tuple are not possible.
 
     Example:
         >>> simulate_trials(
@@ -296,26 +859,117 @@ def simulate_trials(
         ...     trials=1000,
         ...     main_phase_steps=[main_phase_fourth_cancel_bonus_damage],
         ... )
+
+    ``backend="numpy"`` resolves all trials at once with vectorized NumPy
+    kernels driven by a ``numpy.random.Generator``. It samples the same
+    distribution as the default ``"python"`` backend but not the same random
+    stream. The built-in :func:`main_phase_fourth_cancel_bonus_damage` and
+    :func:`reveal_nine_clock_climaxes` steps run vectorized too; any other
+    step falls back to ``"python"`` because arbitrary callables need a live
+    :class:`DeckState`. A lone built-in step with no battle damage on a deck
+    large enough to avoid a refresh is sampled from its closed-form
+    distribution in :mod:`ws_sim.analytic`, as is a lone damage with no steps
+    and no soul trigger check.
+
+    ``backend="numba"`` runs compiled per-trial kernels in parallel (requires
+    the optional ``numba`` package). The built-in
+    :func:`main_phase_fourth_cancel_bonus_damage` and
+    :func:`reveal_nine_clock_climaxes` steps run inside the kernel; any other
+    step falls back to ``"python"``.
+
+    ``workers`` greater than one shards the trials across a process pool, each
+    chunk seeded from ``numpy.random.SeedSequence(seed).spawn(...)`` so results
+    stay reproducible for a fixed ``(seed, workers)`` pair. Steps that cannot be
+    pickled (such as closures) run sequentially instead, with a
+    :class:`RuntimeWarning`. Each call starts its own process pool unless an
+    ``executor`` is passed in to run the chunks on; the results do not depend
+    on which pool runs them. ``executor`` is ignored without ``workers > 1``.
     """
 
     if trials <= 0:
         raise ValueError("trials must be positive")
-
-    normalized_damage_sequence: Tuple[DamageEvent, ...] = tuple(
-        _normalize_damage_event(damage) for damage in damage_sequence
-    )
+    if backend not in SIMULATION_BACKENDS:
+        raise ValueError(f"backend must be one of {SIMULATION_BACKENDS}")
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be positive")
+
+    raw_damages = tuple(damage_sequence)
+    # Plain parallel tuples for the backends, split once per call. A sequence
+    # of non-negative ints (the common case) needs no DamageEvent per entry.
+    if all(type(damage) is int for damage in raw_damages) and min(raw_damages, default=0) >= 0:
+        base_damages: Tuple[int, ...] = raw_damages
+        attack_flags: Tuple[bool, ...] = (True,) * len(raw_damages)
+    else:
+        normalized_damage_sequence = tuple(_normalize_damage_event(damage) for damage in raw_damages)
+        base_damages = tuple(event.base_damage for event in normalized_damage_sequence)
+        attack_flags = tuple(event.is_attack for event in normalized_damage_sequence)
 
     steps: Tuple[MainPhaseStep, ...] = tuple(main_phase_steps or ())
     for step in steps:
         if not callable(step):
             raise ValueError("All main_phase_steps must be callable")
 
-    rng = random.Random(seed)
+    if workers not in (None, 1) and trials > 1:
+        if _is_picklable(steps):
+            return _simulate_trials_parallel(
+                raw_damages, deck_config, trials, seed, steps, backend, workers, executor
+            )
+        warnings.warn(
+            "main_phase_steps cannot be pickled; ignoring workers and running sequentially",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    if backend == "numpy":
+        if not base_damages and steps:
+            sampled = _sample_single_step_analytic(steps, deck_config, trials, seed)
+            if sampled is not None:
+                return sampled
+        if len(base_damages) == 1 and not steps:
+            sampled = _sample_single_damage_analytic(
+                base_damages[0], attack_flags[0], deck_config, trials, seed
+            )
+            if sampled is not None:
+                return sampled
+        step_opcodes = _kernel_step_opcodes(steps) if steps else []
+        if step_opcodes is not None:
+            return _simulate_trials_numpy(
+                base_damages, attack_flags, deck_config, trials, seed, step_opcodes
+            )
+    if backend == "numba":
+        step_opcodes = _kernel_step_opcodes(steps)
+        if step_opcodes is not None:
+            return _simulate_trials_numba(
+                base_damages, attack_flags, step_opcodes, deck_config, trials, seed
+            )
+
+    rng = make_rng(deck_config.rng_backend, seed)
+    waiting_room_template = waiting_room_template_for(deck_config)
+    damage_kernel = _compile_damage_kernel(
+        tuple(zip(base_damages, attack_flags)),
+        deck_config.attacking_deck_size is not None,
+    )
     results: List[int] = []
+    deck_state = DeckState(deck_config, rng, waiting_room_template)
+    attacking_state = _build_attacking_deck(deck_config, rng)
+    reset_deck = deck_state.reset
+    reset_attacks = attacking_state.reset if attacking_state else None
+    reveal = deck_state.reveal
+    trigger = attacking_state.resolve_soul_trigger if attacking_state else None
+
+    if not steps:
+        # Battle-only fast path: no step dispatch or damage checks per trial.
+        append = results.append
+        for _ in range(trials):
+            reset_deck()
+            if reset_attacks:
+                reset_attacks()
+            append(damage_kernel(reveal, trigger))
+        return np.array(results, dtype=DAMAGE_DTYPE)
 
     for _ in range(trials):
-        deck_state = DeckState(deck_config, rng)
-        attacking_state = _build_attacking_deck(deck_config, rng)
+        reset_deck()
+        if reset_attacks:
+            reset_attacks()
         total_damage = 0
         for step in steps:
             step_damage = step(deck_state)
@@ -324,20 +978,10 @@ def simulate_trials(
             if step_damage < 0:
                 raise ValueError("main_phase_steps cannot return negative damage")
             total_damage += step_damage
-        for event in normalized_damage_sequence:
-            if event.is_attack:
-                dealt, refresh_penalty = _simulate_attack(
-                    event.base_damage, deck_state, attacking_state
-                )
-                total_damage += dealt + refresh_penalty
-            else:
-                dealt, refresh_penalty, _, _ = _resolve_damage_event(
-                    event.base_damage, deck_state
-                )
-                total_damage += dealt + refresh_penalty
+        total_damage += damage_kernel(reveal, trigger)
         results.append(total_damage)
 
-    return results
+    return np.array(results, dtype=DAMAGE_DTYPE)
 
 
 def main_phase_fourth_cancel_bonus_damage(deck_state: DeckState) -> int:
@@ -366,27 +1010,106 @@ def reveal_nine_clock_climaxes(deck_state: DeckState) -> int:
     penalties are added to the returned damage before battle damage resolves.
     """
 
-    climax_count = 0
-    refresh_penalty = 0
-    for _ in range(9):
-        card, refreshed = deck_state.draw()
-        if refreshed:
-            refresh_penalty += 1
-        if card:
-            climax_count += 1
+    _, climax_count, refresh_penalty = deck_state.reveal(9)
     return climax_count + refresh_penalty
 
 
+def _sample_single_step_analytic(
+    steps: Sequence[MainPhaseStep], deck_config: DeckConfig, trials: int, seed: int | None
+) -> np.ndarray | None:
+    """Sample a lone built-in step from its exact distribution, if one applies."""
+
+    if len(steps) != 1:
+        return None
+    step = steps[0]
+    deck_cards = deck_config.deck_cards
+    climax_cards = deck_config.deck_climax_cards
+    rng = np.random.default_rng(seed)
+    if step is main_phase_fourth_cancel_bonus_damage and deck_cards >= 8:
+        p_four = analytic.fourth_cancel_bonus_damage_distribution(deck_cards, climax_cards)[4]
+        return (4 * (rng.random(trials) < p_four)).astype(DAMAGE_DTYPE)
+    if step is reveal_nine_clock_climaxes and deck_cards >= 9:
+        sampled = rng.hypergeometric(climax_cards, deck_cards - climax_cards, 9, size=trials)
+        return sampled.astype(DAMAGE_DTYPE)
+    return None
+
+
+def _sample_single_damage_analytic(
+    damage: int, is_attack: bool, deck_config: DeckConfig, trials: int, seed: int | None
+) -> np.ndarray | None:
+    """Sample a lone cancellable damage from :func:`analytic.p_no_cancel`, if it applies.
+
+    Needs a deck that covers the whole reveal (so no refresh) and no attacking
+    deck trigger that could change the damage.
+    """
+
+    if is_attack and deck_config.attacking_deck_size is not None:
+        return None
+    if damage > deck_config.deck_cards:
+        return None
+    p_dealt = analytic.p_no_cancel(deck_config.deck_cards, deck_config.deck_climax_cards, damage)
+    rng = np.random.default_rng(seed)
+    return (damage * (rng.random(trials) < p_dealt)).astype(DAMAGE_DTYPE)
+
+
+def _kernel_step_opcodes(steps: Sequence[MainPhaseStep]) -> List[int] | None:
+    """Map built-in main phase steps to step opcodes, or ``None`` if any is custom.
+
+    The opcodes are shared by the Numba kernels and the NumPy batch path.
+    """
+
+    known_steps = {
+        main_phase_fourth_cancel_bonus_damage: STEP_FOURTH_CANCEL_BONUS,
+        reveal_nine_clock_climaxes: STEP_REVEAL_NINE_CLOCK,
+    }
+    opcodes = []
+    for step in steps:
+        opcode = known_steps.get(step)
+        if opcode is None:
+            return None
+        opcodes.append(opcode)
+    return opcodes
+
+
+# Largest damage for which ``cumulative_probability_at_least`` histograms the
+# damages instead of sorting them.
+_BINCOUNT_MAX_DAMAGE = 1 << 16
+
+
 def cumulative_probability_at_least(damages: Sequence[int], thresholds: Iterable[int]) -> Mapping[int, float]:
     total_trials = len(damages)
     if total_trials == 0:
         raise ValueError("Damages collection cannot be empty")
 
-    probabilities = {}
-    for threshold in thresholds:
-        count = sum(1 for dmg in damages if dmg >= threshold)
-        probabilities[int(threshold)] = count / total_trials
-    return probabilities
+    damage_values = np.asarray(damages, dtype=np.int64)
+    threshold_values = np.fromiter((int(threshold) for threshold in thresholds), dtype=np.int64)
+    if 0 <= damage_values.min() and damage_values.max() <= _BINCOUNT_MAX_DAMAGE:
+        # One O(n) histogram serves every threshold.
+        tail = cumulative_probability_at_least_array(damage_values)
+        lookup = tail[np.clip(threshold_values, 0, tail.size - 1)]
+        probabilities = np.where(threshold_values < tail.size, lookup, 0.0)
+    else:
+        sorted_damages = np.sort(damage_values)
+        counts = total_trials - np.searchsorted(sorted_damages, threshold_values, side="left")
+        probabilities = counts / total_trials
+    return dict(zip(threshold_values.tolist(), probabilities.tolist()))
+
+
+def cumulative_probability_at_least_array(damages: Sequence[int]) -> np.ndarray:
+    """Return ``P(damage >= k)`` for every ``k`` from ``0`` to ``max(damages)``.
+
+    Index ``k`` of the result holds the probability for threshold ``k``; the
+    whole tail is computed from one histogram instead of per threshold.
+    """
+
+    damage_values = np.asarray(damages, dtype=np.int64)
+    if damage_values.size == 0:
+        raise ValueError("Damages collection cannot be empty")
+    if damage_values.min() < 0:
+        raise ValueError("Damages cannot be negative")
+
+    tail_counts = np.cumsum(np.bincount(damage_values)[::-1])[::-1]
+    return tail_counts / damage_values.size
 
 
 def tune_trial_count(
@@ -398,7 +1121,26 @@ def tune_trial_count(
     max_trials: int = 50000,
     step_factor: float = 2.0,
     seed: int | None = None,
+    backend: str = "python",
+    workers: int | None = None,
 ) -> Tuple[int, List[float]]:
+    """Grow the trial count until the ``P(damage >= threshold)`` estimate settles.
+
+    Trials are run in batches that grow the running total geometrically by
+    ``step_factor``; each batch only simulates the additional trials and its
+    hits are merged into the running estimate. ``history`` records the running
+    estimate after every batch, and every batch draws its seed from its own
+    ``SeedSequence`` child so the batches are statistically independent.
+    Tuning stops once the 95% Wald confidence half-width
+    ``1.96 * sqrt(p * (1 - p) / n)`` is within ``target_error`` (after at
+    least two batches) or ``max_trials`` is reached.
+
+    ``backend`` and ``workers`` are forwarded to :func:`simulate_trials`. With
+    ``workers > 1`` one process pool is started up front and shared by every
+    batch; its startup cost can still outweigh the gain for small trial
+    counts.
+    """
+
     if min_trials <= 0 or max_trials <= 0:
         raise ValueError("Trial counts must be positive")
     if min_trials > max_trials:
@@ -408,24 +1150,37 @@ def tune_trial_count(
     if target_error <= 0:
         raise ValueError("target_error must be positive")
 
-    rng = random.Random(seed)
+    seed_sequence = np.random.SeedSequence(seed)
     history: List[float] = []
+    completed_trials = 0
+    hits = 0
     trial_count = min_trials
 
-    while True:
-        trial_seed = rng.randint(0, 2**32 - 1)
-        damages = simulate_trials(damage_sequence, deck_config, trials=trial_count, seed=trial_seed)
-        probability = cumulative_probability_at_least(damages, [threshold])[threshold]
-        history.append(probability)
-
-        if len(history) >= 2 and abs(history[-1] - history[-2]) <= target_error:
-            return trial_count, history
+    pool = _make_trial_pool(workers) if workers is not None and workers > 1 else nullcontext()
+    with pool as executor:
+        while True:
+            (batch_sequence,) = seed_sequence.spawn(1)
+            trial_seed = int(batch_sequence.generate_state(1)[0])
+            damages = simulate_trials(
+                damage_sequence,
+                deck_config,
+                trials=trial_count - completed_trials,
+                seed=trial_seed,
+                backend=backend,
+                workers=workers,
+                executor=executor,
+            )
+            hits += int(np.count_nonzero(damages >= threshold))
+            completed_trials = trial_count
+            probability = hits / completed_trials
+            history.append(probability)
 
-        next_trials = min(max_trials, int(trial_count * step_factor))
-        if next_trials == trial_count:
-            return trial_count, history
+            half_width = 1.96 * math.sqrt(probability * (1 - probability) / completed_trials)
+            if len(history) >= 2 and half_width <= target_error:
+                return trial_count, history
 
-        trial_count = next_trials
+            next_trials = min(max_trials, int(trial_count * step_factor))
+            if next_trials == trial_count:
+                return trial_count, history
 
-        if trial_count > max_trials:
-            return max_trials, history
+            trial_count = next_trials
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Mapping, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 def plot_cumulative_histogram(
@@ -14,15 +15,17 @@ def plot_cumulative_histogram(
     if not probabilities:
         raise ValueError("probabilities cannot be empty")
 
-    sorted_thresholds = sorted(probabilities.keys())
-    values = [probabilities[thr] for thr in sorted_thresholds]
+    count = len(probabilities)
+    thresholds = np.fromiter(probabilities.keys(), dtype=np.int64, count=count)
+    values = np.fromiter(probabilities.values(), dtype=np.float64, count=count)
+    order = np.argsort(thresholds, kind="stable")
 
     if ax is None:
         fig, ax = plt.subplots(figsize=(8, 4))
     else:
         fig = ax.get_figure()
 
-    ax.bar(sorted_thresholds, values, width=0.8, align="center")
+    ax.bar(thresholds[order], values[order], width=0.8, align="center")
     ax.set_xlabel("Damage threshold (≥ X)")
     ax.set_ylabel("Probability")
     ax.set_ylim(0, 1)